@@ -4,25 +4,73 @@ import warnings
 warnings.filterwarnings("ignore")
 
 import argparse
+import codecs
+import contextlib
+import functools
 import io
 import json
 import os
 import select
 import sys
 import termios
+import threading
 import tty
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from axon.generator import generate_image
 from axon.logo import animate_logo, render_logo
-from axon.renderer import load_lut, render_image, render_preview
+from axon.renderer import build_grid, load_lut, render_grid, render_preview
 from axon.terminal import get_terminal_width
 
 
+def _sgr(*codes: int) -> str:
+    """Join SGR parameters into a single CSI ... m escape sequence."""
+    return f"\033[{';'.join(str(c) for c in codes)}m"
+
+
+_LIGHT_BROWN = _sgr(38, 5, 137)
+_DIM = _sgr(38, 5, 238)
+_WHITE = _sgr(38, 5, 231)
+_SOFT = _sgr(38, 5, 250)
+_RESET = _sgr(0)
+_BAR = f"{_LIGHT_BROWN}\u2502{_RESET} "
+_HIDE_CURSOR = "\033[?25l"
+_SHOW_CURSOR = "\033[?25h"
+_CLEAR_LINE = "\r\033[2K"
+
+# Empty prompt: bar + dim hint, cursor moved back to the start of the hint
+_PLACEHOLDER = "Describe what you see"
+_PLACEHOLDER_LINE = f"{_CLEAR_LINE}  {_BAR}{_DIM}{_PLACEHOLDER}{_RESET}\033[{len(_PLACEHOLDER)}D"
+
+
+class _Frame:
+    """Accumulate one redraw and send it to the terminal in a single write."""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+
+    def flush(self) -> None:
+        # Anything still sitting in the text layer must go out first
+        sys.stdout.flush()
+        sys.stdout.buffer.write("".join(self._parts).encode())
+        sys.stdout.buffer.flush()
+        self._parts.clear()
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="axon",
@@ -53,6 +101,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Caption text on the polaroid border (requires --pola)",
     )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="Save to ~/axon_gallery when output is piped or redirected; "
+             "ignored in a terminal, where the Save menu already defaults to Yes",
+    )
     return parser.parse_args()
 
 
@@ -81,109 +135,267 @@ _GLYPHS = [
 ]
 
 
+def _json_bytes(obj) -> bytes:
+    """Serialize obj as UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+
+def _json_load(data: bytes):
+    """Parse UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _palette_cache_path() -> Path:
+    """Where decoded palette LUTs are kept between runs."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "axon" / "palettes.json"
+
+
+# Bump whenever the quantizer or load_lut sampling changes, so cached
+# remaps built by an older version are decoded again.
+_PALETTE_CACHE_FORMAT = 2
+
+
+def _valid_remap(remap) -> bool:
+    """True for a cached remap that is None or 256 ints in 0..255."""
+    if remap is None:
+        return True
+    return (isinstance(remap, list) and len(remap) == 256
+            and all(type(v) is int and 0 <= v <= 255 for v in remap))
+
+
+def _load_palette(png: Path):
+    """Load one LUT PNG as a remap table, or None if it can't be read."""
+    try:
+        return load_lut(str(png))
+    except Exception:
+        return None
+
 
 def _scan_palettes():
     """Scan palettes/ folder for LUT PNG files.
 
-    Returns list of (name, remap_or_none). First entry is always ("None", None).
+    Returns list of (name, uint8 remap or None). First entry is always ("None", None).
     """
-    palettes = [("None", None)]
     lut_dir = Path(__file__).resolve().parent.parent / "palettes"
+    stamps = []
     if lut_dir.is_dir():
         for png in sorted(lut_dir.glob("*.png")):
             try:
-                remap = load_lut(str(png))
-                name = png.stem.capitalize()
-                palettes.append((name, remap))
-            except Exception:
+                stamps.append((png, png.stat().st_mtime_ns))
+            except OSError:
                 continue
+    return _load_palettes(tuple(stamps))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_palettes(stamps: tuple) -> list:
+    """Build the palette list for (png, mtime_ns) pairs.
+
+    LUTs whose mtime matches a well-formed entry in a current-format on-disk
+    cache are not decoded again; the rest are decoded in parallel (PIL
+    releases the GIL while inflating).
+    """
+    cache_path = _palette_cache_path()
+    try:
+        cached = _json_load(cache_path.read_bytes())
+    except (OSError, ValueError):
+        cached = {}
+    if not isinstance(cached, dict) or cached.get("format") != _PALETTE_CACHE_FORMAT:
+        cached = {}
+    cached = cached.get("palettes")
+    if not isinstance(cached, dict):
+        cached = {}
+
+    entries = {}
+    stale = []
+    for png, mtime in stamps:
+        entry = cached.get(png.name)
+        if (isinstance(entry, dict) and entry.get("mtime_ns") == mtime
+                and _valid_remap(entry.get("remap"))):
+            entries[png.name] = entry
+        else:
+            stale.append((png, mtime))
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            remaps = pool.map(_load_palette, [png for png, _ in stale])
+            for (png, mtime), remap in zip(stale, remaps):
+                entries[png.name] = {
+                    "mtime_ns": mtime,
+                    "remap": None if remap is None else remap.tolist(),
+                }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_json_bytes({"format": _PALETTE_CACHE_FORMAT,
+                                                "palettes": entries}))
+        except OSError:
+            pass
+
+    palettes = [("None", None)]
+    for png, _ in stamps:
+        remap = entries[png.name]["remap"]
+        if remap is not None:
+            palettes.append((png.stem.capitalize(), np.asarray(remap, dtype=np.uint8)))
     return palettes
 
 
+def _start_palette_scan() -> Future:
+    """Scan the palette LUTs on a background thread; the result is the palette list."""
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(_scan_palettes)
+    pool.shutdown(wait=False)
+    return future
+
+
+def _wrap(text: str, width: int) -> list:
+    """Split text into chunks of at most width characters (always at least one)."""
+    return [text[i:i + width] for i in range(0, len(text), width)] or [""]
+
+
 def _prompt_input(columns: int) -> Optional[str]:
     """Multi-line prompt editor with │ bar on each line.
 
     Returns the entered text, or None on cancel.
     """
-    light_brown = "\033[38;5;137m"
-    reset = "\033[0m"
-    bar = f"{light_brown}\u2502{reset} "
     prefix_len = 4  # "  │ " = 2 spaces + bar + space
     max_chars = columns - prefix_len
 
     text = ""
     fd = sys.stdin.fileno()
     old = termios.tcgetattr(fd)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def _read_chars():
+        """Yield typed characters, taking everything that has arrived in one read.
+
+        An empty string is yielded after each read, so a whole paste can be
+        drawn once instead of char by char.
+        """
+        while True:
+            data = os.read(fd, 1024)
+            if not data:
+                raise EOFError
+            yield from decoder.decode(data)
+            yield ""
 
     def _render():
         # Split text into lines of max_chars width
-        lines = []
-        remaining = text
-        while len(remaining) > max_chars:
-            lines.append(remaining[:max_chars])
-            remaining = remaining[max_chars:]
-        lines.append(remaining)
+        lines = _wrap(text, max_chars)
 
         # Move up to first line if multi-line
+        frame = _Frame()
         if len(lines) > 1:
-            sys.stdout.write(f"\033[{len(lines) - 1}A")
+            frame.write(f"\033[{len(lines) - 1}A")
         # Draw all lines
         for i, line in enumerate(lines):
-            sys.stdout.write(f"\r\033[2K  {bar}{line}")
+            frame.write(f"{_CLEAR_LINE}  {_BAR}{line}")
             if i < len(lines) - 1:
-                sys.stdout.write("\n")
+                frame.write("\n")
+        frame.flush()
+
+    n = 0  # len(text), kept in step with every edit
+    shown = 0  # how much of text is currently drawn
+    prev_line_count = 1
+    done = False
+    result = None
+
+    def _show():
+        """Draw text appended since the last call."""
+        nonlocal shown, prev_line_count
+        if shown == n:
+            return
+        line_count = (n - 1) // max_chars + 1
+        if line_count == prev_line_count and shown:
+            # No wrap and no placeholder to clear: just echo the new chars
+            sys.stdout.write(text[shown:])
+            sys.stdout.flush()
+        else:
+            if line_count > prev_line_count:
+                sys.stdout.write("\n" * (line_count - prev_line_count))
+            _render()
+        shown = n
+        prev_line_count = line_count
+
+    def _finish(value):
+        nonlocal done, result
+        _show()
+        sys.stdout.write("\n")
         sys.stdout.flush()
+        done = True
+        result = value
+
+    def _submit():
+        _finish(text.strip() if text.strip() else None)
+
+    def _cancel():  # Ctrl-C
+        _finish(None)
+
+    def _backspace():
+        nonlocal text, n, shown, prev_line_count
+        _show()
+        if not n:
+            return
+        old_line_count = prev_line_count
+        text = text[:-1]
+        n -= 1
+        new_line_count = (n - 1) // max_chars + 1 if n else 1
+        # Clear extra line if we went from N to N-1 lines
+        if new_line_count < old_line_count:
+            sys.stdout.write(f"{_CLEAR_LINE}\033[1A")
+        if n and new_line_count == old_line_count and (n + 1) % max_chars:
+            # Same line, cursor not parked at the wrap column: erase in place
+            sys.stdout.write("\b \b")
+            sys.stdout.flush()
+        elif n:
+            _render()
+        else:
+            sys.stdout.write(_PLACEHOLDER_LINE)
+            sys.stdout.flush()
+        shown = n
+        prev_line_count = new_line_count
+
+    def _skip_escape():
+        skipped = 0
+        while skipped < 2:
+            if next(chars):
+                skipped += 1
+            else:
+                _show()
+
+    # Control keys we act on; any other char below space is ignored
+    handlers = {
+        "\r": _submit,
+        "\n": _submit,
+        "\x03": _cancel,
+        "\x7f": _backspace,
+        "\x08": _backspace,
+        "\x1b": _skip_escape,
+    }
 
     # Draw initial bar with placeholder, cursor at start
-    placeholder = "Describe what you see"
-    hint = "\033[38;5;238m"
-    sys.stdout.write(f"  {bar}{hint}{placeholder}{reset}")
-    sys.stdout.write(f"\033[{len(placeholder)}D")
+    sys.stdout.write(_PLACEHOLDER_LINE)
     sys.stdout.flush()
 
     try:
         tty.setraw(fd)
-        prev_line_count = 1
-        while True:
-            ch = sys.stdin.read(1)
-            if ch in ("\r", "\n"):
-                # Count final lines for cursor positioning
-                line_count = max(1, (len(text) + max_chars - 1) // max_chars) if text else 1
-                sys.stdout.write("\n")
-                sys.stdout.flush()
-                return text.strip() if text.strip() else None
-            if ch == "\x03":  # Ctrl-C
-                sys.stdout.write("\n")
-                sys.stdout.flush()
-                return None
-            if ch == "\x7f" or ch == "\x08":  # Backspace
-                if text:
-                    old_line_count = max(1, (len(text) + max_chars - 1) // max_chars) if text else 1
-                    text = text[:-1]
-                    new_line_count = max(1, (len(text) + max_chars - 1) // max_chars) if text else 1
-                    # Clear extra line if we went from N to N-1 lines
-                    if new_line_count < old_line_count:
-                        sys.stdout.write(f"\r\033[2K\033[1A")
-                    if text:
-                        _render()
-                    else:
-                        sys.stdout.write(f"\r\033[2K  {bar}{hint}{placeholder}{reset}")
-                        sys.stdout.write(f"\033[{len(placeholder)}D")
-                        sys.stdout.flush()
-                    prev_line_count = new_line_count
+        chars = _read_chars()
+        while not done:
+            ch = next(chars)
+            if not ch:  # everything that arrived so far is in text
+                _show()
                 continue
-            if ch == "\x1b":  # Skip escape sequences
-                sys.stdin.read(1)
-                sys.stdin.read(1)
-                continue
-            if ord(ch) < 32:  # Skip other control chars
-                continue
-            text += ch
-            line_count = max(1, (len(text) + max_chars - 1) // max_chars)
-            if line_count > prev_line_count:
-                sys.stdout.write("\n")
-            _render()
-            prev_line_count = line_count
+            handler = handlers.get(ch)
+            if handler is not None:
+                handler()
+            elif ch >= " ":
+                text += ch
+                n += 1
+        return result
     except (EOFError, KeyboardInterrupt):
         sys.stdout.write("\n")
         sys.stdout.flush()
@@ -201,35 +413,92 @@ def _flush_input():
         while select.select([fd], [], [], 0)[0]:
             os.read(fd, 1024)
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old)
-
-
-def _read_key():
-    """Read a single keypress (handles arrow keys)."""
-    fd = sys.stdin.fileno()
+        termios.tcsetattr(fd, termios.TCSANOW, old)
+
+
+_ARROWS = {b"A": "up", b"B": "down", b"C": "right", b"D": "left"}
+
+
+def _read_key(fd: int) -> str:
+    """Read a single keypress from fd; the caller owns the terminal mode."""
+    # Read the fd directly: sys.stdin's buffer would hide pending keys from select()
+    data = os.read(fd, 1)
+    if not data:  # EOF: the terminal went away, so leave the menu
+        return "quit"
+    if data == b"\x1b":
+        # Only a CSI introducer has a third byte; a lone Esc or Alt+key stops here
+        data += os.read(fd, 1)
+        if data[1:2] == b"[":
+            arrow = _ARROWS.get(os.read(fd, 1))
+            if arrow:
+                return arrow
+    ch = data[:1].decode("latin-1")
+    if ch in ("\r", "\n"):
+        return "enter"
+    if ch == "q" or ch == "\x03":  # q or Ctrl-C
+        return "quit"
+    return ch
+
+
+@contextlib.contextmanager
+def _key_mode(fd: int):
+    """Read unbuffered, unechoed keys from the tty for the duration of the block.
+
+    Unlike tty.setraw, output processing stays on so newlines still return to
+    column 0 while menus redraw. Both switches use TCSANOW.
+    """
     old = termios.tcgetattr(fd)
+    mode = termios.tcgetattr(fd)
+    mode[0] &= ~(termios.ICRNL | termios.IXON)
+    mode[3] &= ~(termios.ECHO | termios.ICANON | termios.ISIG | termios.IEXTEN)
+    mode[6][termios.VMIN] = 1
+    mode[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSANOW, mode)
     try:
-        tty.setraw(fd)
-        ch = sys.stdin.read(1)
-        if ch == "\x1b":
-            ch2 = sys.stdin.read(1)
-            if ch2 == "[":
-                ch3 = sys.stdin.read(1)
-                if ch3 == "A":
-                    return "up"
-                if ch3 == "B":
-                    return "down"
-                if ch3 == "C":
-                    return "right"
-                if ch3 == "D":
-                    return "left"
-        if ch in ("\r", "\n"):
-            return "enter"
-        if ch == "q" or ch == "\x03":  # q or Ctrl-C
-            return "quit"
-        return ch
+        yield
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+        termios.tcsetattr(fd, termios.TCSANOW, old)
+
+
+def _clear_block(line_count: int) -> str:
+    """Escape sequence that blanks line_count lines ending at the cursor's line.
+
+    The cursor is left at the start of the first of those lines.
+    """
+    up = f"\033[{line_count - 1}A\r" if line_count > 1 else "\r"
+    return up + "\033[2K\n" * (line_count - 1) + "\033[2K" + up
+
+
+def _menu_rows(settings: list) -> list:
+    """Pre-render every line a settings menu can show.
+
+    Returns rows[row][active][selected] -> line. The menu shape is fixed for
+    the session, so a redraw only picks and joins lines.
+    """
+    # Align labels on the longest one
+    max_label = max(len(label) for label, _ in settings)
+    rows = []
+    for label, options in settings:
+        padded = label.ljust(max_label)
+        variants = []
+        for active in (False, True):
+            head = f"  {_LIGHT_BROWN if active else _DIM}{padded}:  "
+            current = _WHITE if active else _SOFT
+            # Each option in its two states for this row state; a line is a join
+            plain = [f"{_DIM}{name}" for name, _ in options]
+            lit = [f"{current}{name}" for name, _ in options]
+            variants.append([
+                head + "  ".join(plain[:sel] + [lit[sel]] + plain[sel + 1:]) + _RESET
+                for sel in range(len(options))
+            ])
+        rows.append(variants)
+    return rows
+
+
+def _menu_text(rows: list, active_row: int, selected) -> str:
+    """Join the pre-rendered menu lines for one menu state."""
+    return "\n".join([lines[row == active_row][sel]
+                      for row, (lines, sel) in enumerate(zip(rows, selected))])
 
 
 def _image_height(columns: int, border: bool, caption: Optional[str]) -> int:
@@ -250,10 +519,6 @@ def _image_height(columns: int, border: bool, caption: Optional[str]) -> int:
 
 def _yes_no_menu(label: str, default: int = 1) -> bool:
     """Show a horizontal Yes/No menu. Returns True if Yes selected."""
-    dim = "\033[38;5;238m"
-    light_brown = "\033[38;5;137m"
-    white = "\033[38;5;231m"
-    reset = "\033[0m"
     sel = default  # 0=Yes, 1=No
 
     def _draw():
@@ -261,53 +526,60 @@ def _yes_no_menu(label: str, default: int = 1) -> bool:
         parts = []
         for i, name in enumerate(options):
             if i == sel:
-                parts.append(f"{light_brown}>{white} {name}{reset}")
+                parts.append(f"{_LIGHT_BROWN}>{_WHITE} {name}")
             else:
-                parts.append(f"  {dim}{name}{reset}")
-        return f"  {light_brown}{label}:{reset}  " + "  ".join(parts)
+                parts.append(f"  {_DIM}{name}")
+        return f"  {_LIGHT_BROWN}{label}:  " + "  ".join(parts) + _RESET
 
-    sys.stdout.write("\033[?25l")
+    sys.stdout.write(_HIDE_CURSOR)
     sys.stdout.write(_draw())
     sys.stdout.flush()
 
+    fd = sys.stdin.fileno()
     try:
-        while True:
-            key = _read_key()
-            if key in ("quit", "enter"):
-                break
-            prev = sel
-            if key == "left" and sel > 0:
-                sel -= 1
-            elif key == "right" and sel < 1:
-                sel += 1
-            if sel != prev:
-                sys.stdout.write(f"\r\033[2K{_draw()}")
-                sys.stdout.flush()
+        with _key_mode(fd):
+            while True:
+                key = _read_key(fd)
+                if key in ("quit", "enter"):
+                    break
+                prev = sel
+                if key == "left" and sel > 0:
+                    sel -= 1
+                elif key == "right" and sel < 1:
+                    sel += 1
+                if sel != prev:
+                    sys.stdout.write(f"{_CLEAR_LINE}{_draw()}")
+                    sys.stdout.flush()
     finally:
-        sys.stdout.write("\033[?25h\n")
+        sys.stdout.write(_SHOW_CURSOR + "\n")
         sys.stdout.flush()
 
     # Clear menu line and show confirmed choice
     confirmed = "yes" if sel == 0 else "no"
-    sys.stdout.write(f"\033[1A\033[2K  {dim}{label}:{reset}  {confirmed}\n")
+    sys.stdout.write(f"\033[1A\033[2K  {_DIM}{label}:{_RESET}  {confirmed}\n")
     sys.stdout.flush()
 
     return sel == 0
 
 
 def _generate_and_display(prompt: str, columns: int, size: int,
-                          pola: bool, caption: Optional[str]) -> None:
-    """Generate an image and display it in the terminal."""
-    dim = "\033[38;5;238m"
-    light_brown = "\033[38;5;137m"
-    white = "\033[38;5;231m"
-    reset = "\033[0m"
+                          pola: bool, caption: Optional[str],
+                          palettes_future: Optional[Future] = None,
+                          save: bool = False) -> None:
+    """Generate an image and display it in the terminal.
 
+    When stdin or stdout is not a terminal only the default render is
+    printed; save asks for the gallery files in that case too.
+    """
+    # Decode the palette LUTs while Gemini works, unless the caller already
+    # started that. The request itself stays on this thread so Ctrl-C still
+    # interrupts it and stops its spinner.
+    if palettes_future is None:
+        palettes_future = _start_palette_scan()
     image_bytes = generate_image(prompt, width=size, height=size)
+    palettes = palettes_future.result()
     image = Image.open(io.BytesIO(image_bytes))
 
-    palettes = _scan_palettes()
-
     # Settings state: [filter, dither, poster, glyph, palette]
     selected = [0, 0, 0, 0, 0]
     active_row = 0
@@ -323,30 +595,16 @@ def _generate_and_display(prompt: str, columns: int, size: int,
     # total = blank line + image + blank line + 2 menu lines
     menu_lines = len(settings)
     total_lines = 1 + img_lines + 1 + menu_lines
+    # The block's height is fixed for the session, so are its cursor moves
+    up_to_image = f"\033[{total_lines - 1}A\r\n"
+    clear_menu = _clear_block(menu_lines)
 
-    # Align labels on the longest one
-    max_label = max(len(label) for label, _ in settings)
-    soft = "\033[38;5;250m"
-
-    def _menu_str():
-        lines = []
-        for row, (label, options) in enumerate(settings):
-            active = row == active_row
-            padded = label.ljust(max_label)
-            parts = []
-            for i, (name, _) in enumerate(options):
-                if i == selected[row]:
-                    if active:
-                        parts.append(f"{white}{name}{reset}")
-                    else:
-                        parts.append(f"{soft}{name}{reset}")
-                else:
-                    parts.append(f"{dim}{name}{reset}")
-            if active:
-                lines.append(f"  {light_brown}{padded}:{reset}  " + "  ".join(parts))
-            else:
-                lines.append(f"  {dim}{padded}:{reset}  " + "  ".join(parts))
-        return "\n".join(lines)
+    menu_rows = _menu_rows(settings)
+
+    @functools.lru_cache(maxsize=512)
+    def _menu_str(active_row, selected):
+        """Build the settings menu; settings are fixed for the session, so cache per state."""
+        return _menu_text(menu_rows, active_row, selected)
 
     def _current_resample():
         _, resample = _FILTERS[selected[0]]
@@ -360,104 +618,195 @@ def _generate_and_display(prompt: str, columns: int, size: int,
         _, poster = _POSTERS[selected[2]]
         return poster
 
-    def _current_glyph():
-        _, glyph = _GLYPHS[selected[3]]
-        return glyph
-
     def _current_remap():
         _, remap = palettes[selected[4]]
         return remap
 
+    @functools.lru_cache(maxsize=16)
+    def _grid_cached(fi, di, pi):
+        """Resize + quantize once per filter/texture/poster; palette and glyph reuse it."""
+        return build_grid(image, columns, border=pola, resample=_FILTERS[fi][1],
+                          dither=_DITHERS[di][1], poster=_POSTERS[pi][1])
+
+    @functools.lru_cache(maxsize=64)
+    def _render_cached(fi, di, pi, gi, pali):
+        """Render one settings combination, keyed on option indices (LUTs aren't hashable)."""
+        return render_grid(_grid_cached(fi, di, pi), columns, border=pola,
+                           caption=caption, remap=palettes[pali][1], glyph=_GLYPHS[gi][1])
+
+    def _write_outputs(do_save, do_export, plain=False):
+        """Save the original + preview and/or export JSON for the current settings.
+
+        plain reports the paths on stderr without escapes, for redirected output.
+        """
+        def _report(label, path):
+            if plain:
+                print(f"{label}: {path}", file=sys.stderr)
+            else:
+                print(f"  {_DIM}{label.ljust(8)}:{_RESET}  {path}")
+
+        final_resample = _current_resample()
+        final_dither = _current_dither()
+        final_poster = _current_poster()
+        final_remap = _current_remap()
+        gallery = Path.home() / "axon_gallery"
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+
+        if do_save or do_export:
+            gallery.mkdir(exist_ok=True)
+            if not plain:
+                print()
+
+        if do_save:
+            png_path = gallery / f"axon_{timestamp}.png"
+            png_path.write_bytes(image_bytes)
+            _report("Original", png_path)
+
+            preview = render_preview(image, columns, scale=8, resample=final_resample, dither=final_dither, remap=final_remap, poster=final_poster)
+            preview_path = gallery / f"axon_{timestamp}_256.png"
+            preview.save(preview_path)
+            _report("Render", preview_path)
+
+        if do_export:
+            # Same settings as the last frame on screen, so this is a cache hit
+            rendered = _render_cached(*selected)
+            lines = rendered.split("\n")
+            json_data = {
+                "width": columns,
+                "height": len(lines),
+                "lines": lines,
+            }
+            json_path = gallery / f"axon_{timestamp}.json"
+            json_path.write_bytes(_json_bytes(json_data))
+            _report("JSON", json_path)
+
+        if not plain:
+            print()
+
+    if not (sys.stdin.isatty() and sys.stdout.isatty()):
+        # Piped or redirected: no menus or cursor control, default settings
+        frame = _Frame()
+        frame.write(_render_cached(*selected))
+        frame.write("\n")
+        frame.flush()
+        _write_outputs(save, False, plain=True)
+        return
+
+    # Settings of the image currently on screen
+    drawn = [None]
+
     def _draw_all():
         """Draw image + blank + menu. Cursor ends on last menu line."""
-        sys.stdout.write("\n")
-        rendered = render_image(image, columns, border=pola, caption=caption,
-                                resample=_current_resample(), dither=_current_dither(),
-                                remap=_current_remap(), poster=_current_poster(),
-                                glyph=_current_glyph())
-        sys.stdout.write(rendered)
-        sys.stdout.write(f"\n\n{_menu_str()}")
-        sys.stdout.flush()
+        key = tuple(selected)
+        drawn[0] = key
+        frame = _Frame()
+        frame.write("\n")
+        frame.write(_render_cached(*key))
+        frame.write(f"\n\n{_menu_str(active_row, key)}")
+        frame.flush()
         _flush_input()
 
     def _redraw_menu_only():
         """Redraw just the menu lines (cursor is on last menu line)."""
-        # Move up to first menu line
-        if menu_lines > 1:
-            sys.stdout.write(f"\033[{menu_lines - 1}A\r")
-        else:
-            sys.stdout.write("\r")
-        for i in range(menu_lines):
-            sys.stdout.write(f"\033[2K")
-            if i < menu_lines - 1:
-                sys.stdout.write("\n")
-        # Now cursor is on last menu line, move back to first
-        if menu_lines > 1:
-            sys.stdout.write(f"\033[{menu_lines - 1}A\r")
-        else:
-            sys.stdout.write("\r")
-        sys.stdout.write(_menu_str())
-        sys.stdout.flush()
+        frame = _Frame()
+        frame.write(clear_menu)
+        frame.write(_menu_str(active_row, tuple(selected)))
+        frame.flush()
+
+    # Re-renders run on a worker thread so a held arrow never waits on the
+    # pipeline. The main thread posts the latest settings into a one-entry
+    # slot; states superseded before the worker gets to them are never rendered.
+    draw_lock = threading.Lock()
+    slot_lock = threading.Lock()
+    wake = threading.Event()
+    pending = [None]
+    stopping = False
+
+    def _render_worker():
+        while True:
+            wake.wait()
+            # Take the slot and the stop flag together: once stopping is set
+            # nothing more is posted, so this state is the last one
+            with slot_lock:
+                wake.clear()
+                key, pending[0] = pending[0], None
+                last = stopping
+            # A key equal to drawn[0] was swept away and back; the image is still right
+            if key is not None and key != drawn[0]:
+                rendered = _render_cached(*key)
+                with draw_lock:
+                    drawn[0] = key
+                    frame = _Frame()
+                    frame.write(up_to_image)
+                    frame.write(rendered)
+                    frame.write(f"\n\n{_menu_str(active_row, tuple(selected))}")
+                    frame.flush()
+            if last:
+                return
+
+    def _post_render():
+        with slot_lock:
+            pending[0] = tuple(selected)
+            wake.set()
 
     # First render
-    sys.stdout.write("\033[?25l")
+    sys.stdout.write(_HIDE_CURSOR)
     _draw_all()
 
-    # Disable echo for the entire interactive loop to prevent ^[[C artifacts
+    worker = threading.Thread(target=_render_worker, daemon=True)
+    worker.start()
+
+    # Key mode for the entire interactive loop: no ^[[C echo, no per-key tty toggling
     fd = sys.stdin.fileno()
-    old_term = termios.tcgetattr(fd)
-    no_echo = termios.tcgetattr(fd)
-    no_echo[3] = no_echo[3] & ~termios.ECHO
-    termios.tcsetattr(fd, termios.TCSADRAIN, no_echo)
     try:
-        while True:
-            key = _read_key()
-
-            if key in ("quit", "enter"):
-                break
-
-            if key == "up" and active_row > 0:
-                active_row -= 1
-                _redraw_menu_only()
-            elif key == "down" and active_row < len(settings) - 1:
-                active_row += 1
-                _redraw_menu_only()
-            elif key == "left" or key == "right":
-                _, options = settings[active_row]
-                prev = selected[active_row]
-                if key == "left" and selected[active_row] > 0:
-                    selected[active_row] -= 1
-                elif key == "right" and selected[active_row] < len(options) - 1:
-                    selected[active_row] += 1
-                if selected[active_row] != prev:
-                    # Value changed → re-render image + menu
-                    sys.stdout.write(f"\033[{total_lines - 1}A\r")
-                    _draw_all()
+        with _key_mode(fd):
+            done = False
+            while not done:
+                prev_row = active_row
+                prev_selected = list(selected)
+
+                # Apply every key already queued (e.g. a held arrow) before redrawing once
+                key = _read_key(fd)
+                while True:
+                    if key in ("quit", "enter"):
+                        done = True
+                        break
+                    if key == "up" and active_row > 0:
+                        active_row -= 1
+                    elif key == "down" and active_row < len(settings) - 1:
+                        active_row += 1
+                    elif key == "left" and selected[active_row] > 0:
+                        selected[active_row] -= 1
+                    elif key == "right" and selected[active_row] < len(settings[active_row][1]) - 1:
+                        selected[active_row] += 1
+                    if not select.select([fd], [], [], 0)[0]:
+                        break
+                    key = _read_key(fd)
+
+                if selected != prev_selected or active_row != prev_row:
+                    # The menu updates at once; the image follows from the worker
+                    with draw_lock:
+                        _redraw_menu_only()
+                    if selected != prev_selected:
+                        _post_render()
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_term)
-        sys.stdout.write("\033[?25h\n")
+        # Let the worker finish the last posted state so the screen matches it
+        with slot_lock:
+            stopping = True
+            wake.set()
+        worker.join()
+        sys.stdout.write(_SHOW_CURSOR + "\n")
         sys.stdout.flush()
 
     # Replace menu with single-line summary
     summary_parts = []
     for row, (label, options) in enumerate(settings):
         name, _ = options[selected[row]]
-        summary_parts.append(f"{dim}{label}:{reset} {white}{name}{reset}")
-    sys.stdout.write(f"\033[{menu_lines}A")
-    for i in range(menu_lines):
-        sys.stdout.write(f"\033[2K\n")
-    sys.stdout.write(f"\033[{menu_lines}A")
-    sys.stdout.write(f"  {'  '.join(summary_parts)}\n\n")
-    sys.stdout.flush()
-
-    final_resample = _current_resample()
-    final_dither = _current_dither()
-    final_poster = _current_poster()
-    final_glyph = _current_glyph()
-    final_remap = _current_remap()
-    gallery = Path.home() / "axon_gallery"
-    gallery.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+        summary_parts.append(f"{_DIM}{label}: {_WHITE}{name}")
+    frame = _Frame()
+    frame.write(f"\033[{menu_lines}A" + "\033[2K\n" * menu_lines + f"\033[{menu_lines}A")
+    frame.write(f"  {'  '.join(summary_parts)}{_RESET}\n\n")
+    frame.flush()
 
     # Export menu
     _YES_NO = [("Yes", True), ("No", False)]
@@ -467,164 +816,102 @@ def _generate_and_display(prompt: str, columns: int, size: int,
     ]
     export_selected = [0, 1]  # Save=Yes, Export=No
     export_active = 0
-    export_max_label = max(len(l) for l, _ in export_settings)
+    export_rows = _menu_rows(export_settings)
 
     def _export_menu_str():
-        lines = []
-        for row, (label, options) in enumerate(export_settings):
-            active = row == export_active
-            padded = label.ljust(export_max_label)
-            parts = []
-            for i, (name, _) in enumerate(options):
-                if i == export_selected[row]:
-                    if active:
-                        parts.append(f"{white}{name}{reset}")
-                    else:
-                        parts.append(f"{soft}{name}{reset}")
-                else:
-                    parts.append(f"{dim}{name}{reset}")
-            if active:
-                lines.append(f"  {light_brown}{padded}:{reset}  " + "  ".join(parts))
-            else:
-                lines.append(f"  {dim}{padded}:{reset}  " + "  ".join(parts))
-        return "\n".join(lines)
+        return _menu_text(export_rows, export_active, export_selected)
 
     export_menu_lines = len(export_settings)
-    sys.stdout.write("\033[?25l")
+    sys.stdout.write(_HIDE_CURSOR)
     sys.stdout.write(_export_menu_str())
     sys.stdout.flush()
 
     fd = sys.stdin.fileno()
-    old_term = termios.tcgetattr(fd)
-    no_echo = termios.tcgetattr(fd)
-    no_echo[3] = no_echo[3] & ~termios.ECHO
-    termios.tcsetattr(fd, termios.TCSADRAIN, no_echo)
     try:
-        while True:
-            key = _read_key()
-            if key in ("quit", "enter"):
-                break
-            if key == "up" and export_active > 0:
-                export_active -= 1
-            elif key == "down" and export_active < export_menu_lines - 1:
-                export_active += 1
-            elif key == "left" and export_selected[export_active] > 0:
-                export_selected[export_active] -= 1
-            elif key == "right" and export_selected[export_active] < 1:
-                export_selected[export_active] += 1
-            # Redraw menu
-            if export_menu_lines > 1:
-                sys.stdout.write(f"\033[{export_menu_lines - 1}A\r")
-            else:
-                sys.stdout.write("\r")
-            for i in range(export_menu_lines):
-                sys.stdout.write(f"\033[2K")
-                if i < export_menu_lines - 1:
-                    sys.stdout.write("\n")
-            if export_menu_lines > 1:
-                sys.stdout.write(f"\033[{export_menu_lines - 1}A\r")
-            else:
-                sys.stdout.write("\r")
-            sys.stdout.write(_export_menu_str())
-            sys.stdout.flush()
+        with _key_mode(fd):
+            while True:
+                key = _read_key(fd)
+                if key in ("quit", "enter"):
+                    break
+                if key == "up" and export_active > 0:
+                    export_active -= 1
+                elif key == "down" and export_active < export_menu_lines - 1:
+                    export_active += 1
+                elif key == "left" and export_selected[export_active] > 0:
+                    export_selected[export_active] -= 1
+                elif key == "right" and export_selected[export_active] < 1:
+                    export_selected[export_active] += 1
+                # Redraw menu
+                frame = _Frame()
+                frame.write(_clear_block(export_menu_lines))
+                frame.write(_export_menu_str())
+                frame.flush()
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_term)
-        sys.stdout.write("\033[?25h\n")
+        sys.stdout.write(_SHOW_CURSOR + "\n")
         sys.stdout.flush()
 
     # Single-line summary — go back up over menu lines + blank line from settings summary
     export_summary = []
     for row, (label, options) in enumerate(export_settings):
         name, _ = options[export_selected[row]]
-        export_summary.append(f"{dim}{label}:{reset} {white}{name}{reset}")
+        export_summary.append(f"{_DIM}{label}: {_WHITE}{name}")
     up = export_menu_lines + 1  # +1 for the blank line between settings summary and export menu
-    sys.stdout.write(f"\033[{up}A")
-    for i in range(up):
-        sys.stdout.write(f"\033[2K\n")
-    sys.stdout.write(f"\033[{up}A")
-    sys.stdout.write(f"  {'  '.join(export_summary)}\n")
-    sys.stdout.flush()
+    frame = _Frame()
+    frame.write(f"\033[{up}A" + "\033[2K\n" * up + f"\033[{up}A")
+    frame.write(f"  {'  '.join(export_summary)}{_RESET}\n")
+    frame.flush()
 
     _, do_save = _YES_NO[export_selected[0]]
     _, do_export = _YES_NO[export_selected[1]]
 
-    if do_save or do_export:
-        print()
-
-    if do_save:
-        png_path = gallery / f"axon_{timestamp}.png"
-        png_path.write_bytes(image_bytes)
-        print(f"  {dim}{'Original'.ljust(8)}:{reset}  {png_path}")
-
-        preview = render_preview(image, columns, scale=8, resample=final_resample, dither=final_dither, remap=final_remap, poster=final_poster)
-        preview_path = gallery / f"axon_{timestamp}_256.png"
-        preview.save(preview_path)
-        print(f"  {dim}{'Render'.ljust(8)}:{reset}  {preview_path}")
-
-    if do_export:
-        rendered = render_image(image, columns, border=pola, caption=caption,
-                                resample=final_resample, dither=final_dither,
-                                remap=final_remap, poster=final_poster,
-                                glyph=final_glyph)
-        lines = rendered.split("\n")
-        json_data = {
-            "width": columns,
-            "height": len(lines),
-            "lines": lines,
-        }
-        json_path = gallery / f"axon_{timestamp}.json"
-        json_path.write_text(json.dumps(json_data, ensure_ascii=False))
-        print(f"  {dim}{'JSON'.ljust(8)}:{reset}  {json_path}")
-
-    print()
+    _write_outputs(do_save, do_export)
 
 
 def _interactive() -> None:
     """Interactive mode: logo, config, prompt."""
     columns = get_terminal_width()
-    green = "\033[38;5;46m"
-    light_brown = "\033[38;5;137m"
-    dim = "\033[38;5;238m"
-    reset = "\033[0m"
 
     # White cursor for the whole session
     sys.stdout.write("\033]12;#ffffff\007")
     sys.stdout.flush()
 
+    # The palette LUTs load behind the logo, config and prompt
+    palettes_future = _start_palette_scan()
+
     # Clear screen and animate logo
     print("\033[2J\033[H", end="", flush=True)
-  
+
     # Animate logo into the reserved space
     animate_logo(offset_row=1, offset_col=2)
 
     # Move cursor below subtitle
     print(f"\033[5;1H", end="", flush=True)
-    print(f"  {light_brown}Neural Terminal{reset}")
+    print(f"  {_LIGHT_BROWN}Neural Terminal{_RESET}")
     print()
 
     # Config
     max_width = min(columns, 100)
-    print(f"  {light_brown}Size:{reset}  ", end="", flush=True)
+    print(f"  {_LIGHT_BROWN}Size:{_RESET}  ", end="", flush=True)
     width_input = input().strip()
     if width_input.isdigit() and 20 <= int(width_input) <= max_width:
         render_width = int(width_input)
     else:
         render_width = max_width
-    print(f"\033[1A\033[2K  {dim}Size:{reset}  {render_width}", flush=True)
+    print(f"\033[1A\033[2K  {_DIM}Size:{_RESET}  {render_width}", flush=True)
 
-    print(f"  {light_brown}Pola:{reset}  ", end="", flush=True)
+    print(f"  {_LIGHT_BROWN}Pola:{_RESET}  ", end="", flush=True)
     pola_input = input().strip().lower()
     pola = pola_input in ("y", "yes", "1", "true")
     display_pola = "yes" if pola else "no"
-    print(f"\033[1A\033[2K  {dim}Pola:{reset}  {display_pola}", flush=True)
+    print(f"\033[1A\033[2K  {_DIM}Pola:{_RESET}  {display_pola}", flush=True)
 
     caption = None
     if pola:
-        print(f"  {light_brown}Caption:{reset} ", end="", flush=True)
+        print(f"  {_LIGHT_BROWN}Caption:{_RESET} ", end="", flush=True)
         caption_input = input().strip()
         caption = caption_input if caption_input else None
         display_caption = caption_input if caption_input else "none"
-        print(f"\033[1A\033[2K  {dim}Caption:{reset} {display_caption}", flush=True)
+        print(f"\033[1A\033[2K  {_DIM}Caption:{_RESET} {display_caption}", flush=True)
 
     print()
     prompt = _prompt_input(columns)
@@ -636,23 +923,14 @@ def _interactive() -> None:
         return
 
     # Replace prompt with dim version
-    prompt_lines = []
-    remaining = prompt
-    max_chars = columns - 4
-    while len(remaining) > max_chars:
-        prompt_lines.append(remaining[:max_chars])
-        remaining = remaining[max_chars:]
-    prompt_lines.append(remaining)
-    line_count = len(prompt_lines)
-    sys.stdout.write(f"\033[{line_count}A")
-    for i, line in enumerate(prompt_lines):
-        sys.stdout.write(f"\r\033[2K  {dim}\u2502{reset} {dim}{line}{reset}")
-        if i < line_count - 1:
-            sys.stdout.write("\n")
-    sys.stdout.write("\n")
-    sys.stdout.flush()
+    prompt_lines = _wrap(prompt, columns - 4)
+    frame = _Frame()
+    frame.write(f"\033[{len(prompt_lines)}A")
+    frame.write("\n".join(f"{_CLEAR_LINE}  {_DIM}\u2502 {line}{_RESET}" for line in prompt_lines))
+    frame.write("\n")
+    frame.flush()
 
-    _generate_and_display(prompt, render_width, 768, pola, caption)
+    _generate_and_display(prompt, render_width, 768, pola, caption, palettes_future)
 
     # Reset cursor color
     sys.stdout.write("\033]112\007")
@@ -663,8 +941,14 @@ def main() -> None:
     args = parse_args()
 
     if args.prompt is None:
+        # The config questions, prompt editor and menus all draw on stdout
+        if not (sys.stdin.isatty() and sys.stdout.isatty()):
+            raise SystemExit(
+                "Error: interactive mode needs a terminal.\n"
+                'Pass a prompt to render without one: axon "a prompt" > out.txt'
+            )
         _interactive()
         return
 
     columns = args.width if args.width > 0 else get_terminal_width()
-    _generate_and_display(args.prompt, columns, args.size, args.pola, args.caption)
+    _generate_and_display(args.prompt, columns, args.size, args.pola, args.caption, save=args.save)
@@ -23,22 +23,29 @@ _RESET = "\033[0m"
 _HIDE_CURSOR = "\033[?25l"
 _SHOW_CURSOR = "\033[?25h"
 _DOT = "⸱"
+_DUST_DOTS = [color + _DOT for color in _DUST_COLORS]
+# The dust is random each frame, so 10 fps reads the same as 50 fps.
+_SPINNER_TICK = 0.1
 
 
 def _spinner(stop_event: threading.Event) -> None:
     """Display a dust-particle loader while waiting."""
     sys.stderr.write(_HIDE_CURSOR)
     sys.stderr.write("\n")
+    sys.stderr.flush()
     pad = "  "
     label = f"{pad}{_GRAY}Axon is dreaming{_RESET}"
     label_len = len(pad) + len("Axon is dreaming")
+    # Frames are written to the fd as bytes; the spinner only runs on a tty
+    fd = sys.stderr.fileno()
+    head = f"\r{label} ".encode()
+    tail = _RESET.encode()
+    dust_dots = [dot.encode() for dot in _DUST_DOTS]
 
     try:
         while not stop_event.is_set():
-            dots = "".join(random.choice(_DUST_COLORS) + _DOT for _ in range(15))
-            sys.stderr.write(f"\r{label} {dots}{_RESET}")
-            sys.stderr.flush()
-            stop_event.wait(0.02)
+            os.write(fd, head + b"".join(random.choices(dust_dots, k=15)) + tail)
+            stop_event.wait(_SPINNER_TICK)
     finally:
         sys.stderr.write(f"\r{' ' * (label_len + 1 + 30)}\r")
         sys.stderr.write(f"\033[1A\r")
@@ -62,9 +69,12 @@ def generate_image(prompt: str, width: int = 512, height: int = 512) -> bytes:
 
     client = genai.Client(api_key=api_key)
 
+    # The spinner is cursor tricks only; skip it when stderr is not a terminal
     stop = threading.Event()
-    spinner_thread = threading.Thread(target=_spinner, args=(stop,), daemon=True)
-    spinner_thread.start()
+    spinner_thread = None
+    if sys.stderr.isatty():
+        spinner_thread = threading.Thread(target=_spinner, args=(stop,), daemon=True)
+        spinner_thread.start()
 
     try:
         response = client.models.generate_content(
@@ -97,4 +107,5 @@ def generate_image(prompt: str, width: int = 512, height: int = 512) -> bytes:
         raise SystemExit(f"\n  {err}Something went wrong: {msg}{_RESET}\n") from exc
     finally:
         stop.set()
-        spinner_thread.join()
+        if spinner_thread is not None:
+            spinner_thread.join()
@@ -1,5 +1,7 @@
 """AXON logo as half-block ANSI art with fade-in animation."""
 
+import io
+import os
 import random
 import sys
 import time
@@ -14,50 +16,64 @@ _LOGO = [
 
 LOGO_HEIGHT = (len(_LOGO) + 1) // 2  # half-block lines
 
+# Each row as an int bitmask; column x is bit (_LOGO_WIDTH - 1 - x).
+_LOGO_WIDTH = len(_LOGO[0]) if _LOGO else 0
+_LOGO_BITS = [int(row, 2) for row in _LOGO]
+
 # Grayscale ramp from dark to white (ANSI 256 indices).
 _FADE_STEPS = [232, 233, 234, 235, 237, 239, 241, 243, 245, 247, 249, 251, 253, 255, 231]
 
+# Pre-rendered cells for every fade color, one per half-block shape.
+_RESET = "\033[0m"
+_TOP_BOT = {c: f"\033[38;5;{c};48;5;{c}m\u2580{_RESET}" for c in _FADE_STEPS}
+_TOP_ONLY = {c: f"\033[38;5;{c}m\u2580{_RESET}" for c in _FADE_STEPS}
+_BOT_ONLY = {c: f"\033[38;5;{c}m\u2584{_RESET}" for c in _FADE_STEPS}
+
 
 def _move_to(row, col):
-    """Move cursor to (row, col) — 1-based."""
-    sys.stdout.write(f"\033[{row};{col}H")
+    """Cursor position sequence for (row, col) — 1-based."""
+    return f"\033[{row};{col}H"
 
 
 def _render_cell(row, col, top, bot, color, offset_row, offset_col):
-    """Render a single half-block cell at its screen position."""
-    fg = f"\033[38;5;{color}m"
-    bg = f"\033[48;5;{color}m"
-    reset = "\033[0m"
-
+    """Return the sequence that draws a single half-block cell at its screen position."""
     screen_row = offset_row + row // 2 + 1
     screen_col = offset_col + col + 1
 
-    _move_to(screen_row, screen_col)
-
     if top and bot:
-        sys.stdout.write(f"{fg}{bg}\u2580{reset}")
+        cell = _TOP_BOT[color]
     elif top:
-        sys.stdout.write(f"{fg}\u2580{reset}")
+        cell = _TOP_ONLY[color]
     elif bot:
-        sys.stdout.write(f"{fg}\u2584{reset}")
+        cell = _BOT_ONLY[color]
+    else:
+        return ""
+    return _move_to(screen_row, screen_col) + cell
+
+
+def _write_all(fd, data):
+    """os.write data to fd in full, looping over partial writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 
 def animate_logo(offset_row=1, offset_col=2, delay=0.02):
     """Animate the logo: pixels appear in random order, each fading dark→white."""
-    rows = len(_LOGO)
-    width = len(_LOGO[0]) if rows > 0 else 0
-    empty = "0" * width
+    rows = len(_LOGO_BITS)
+    width = _LOGO_WIDTH
 
-    # Collect all active pixels as (half-block row, col, has_top, has_bot).
+    # Collect all active pixels as (half-block row, col, has_top, has_bot),
+    # visiting only the set bits of each row pair, left to right.
     cells = []
     for y in range(0, rows, 2):
-        top = _LOGO[y]
-        bot = _LOGO[y + 1] if y + 1 < rows else empty
-        for x in range(width):
-            t = top[x] == "1"
-            b = bot[x] == "1"
-            if t or b:
-                cells.append((y, x, t, b))
+        top = _LOGO_BITS[y]
+        bot = _LOGO_BITS[y + 1] if y + 1 < rows else 0
+        mask = top | bot
+        while mask:
+            bit = mask.bit_length() - 1
+            mask ^= 1 << bit
+            cells.append((y, width - 1 - bit, bool(top >> bit & 1), bool(bot >> bit & 1)))
 
     random.shuffle(cells)
 
@@ -65,15 +81,35 @@ def animate_logo(offset_row=1, offset_col=2, delay=0.02):
     sys.stdout.write("\033[?25l")
     sys.stdout.flush()
 
-    # Animate each pixel with a fade-in.
-    for y, x, t, b in cells:
-        for step in _FADE_STEPS:
-            _render_cell(y, x, t, b, step, offset_row, offset_col)
+    # Staggered fade: a new pixel starts every frame and every pixel already
+    # started advances one fade step, so all of them move in a single write.
+    # Frames are paced against deadlines so sleep overshoot doesn't accumulate.
+    fades = [[_render_cell(y, x, t, b, step, offset_row, offset_col) for step in _FADE_STEPS]
+             for y, x, t, b in cells]
+    steps = len(_FADE_STEPS)
+    frames = []
+    for frame in range(len(cells) + steps - 1):
+        first = max(0, frame - steps + 1)
+        last = min(frame, len(cells) - 1)
+        frames.append("".join(fades[i][frame - i] for i in range(first, last + 1)).encode())
+
+    # Frames go straight to the fd as pre-encoded bytes, skipping the text layer.
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        fd = None
+
+    deadline = time.perf_counter()
+    for data in frames:
+        if fd is None:
+            sys.stdout.write(data.decode())
             sys.stdout.flush()
-            time.sleep(delay / len(_FADE_STEPS))
-        # Final white render.
-        _render_cell(y, x, t, b, 231, offset_row, offset_col)
-        sys.stdout.flush()
+        else:
+            _write_all(fd, data)
+        deadline += delay
+        pause = deadline - time.perf_counter()
+        if pause > 0:
+            time.sleep(pause)
 
     # Show cursor again.
     sys.stdout.write("\033[?25h")
@@ -86,17 +122,16 @@ def render_logo(green=46):
     bg = f"\033[48;5;{green}m"
     reset = "\033[0m"
 
-    rows = len(_LOGO)
-    width = len(_LOGO[0]) if rows > 0 else 0
-    empty = "0" * width
+    rows = len(_LOGO_BITS)
+    width = _LOGO_WIDTH
 
     lines = []
     for y in range(0, rows, 2):
-        top = _LOGO[y]
-        bot = _LOGO[y + 1] if y + 1 < rows else empty
+        top = _LOGO_BITS[y]
+        bot = _LOGO_BITS[y + 1] if y + 1 < rows else 0
         parts = []
-        for x in range(len(top)):
-            t, b = top[x] == "1", bot[x] == "1"
+        for bit in range(width - 1, -1, -1):
+            t, b = top >> bit & 1, bot >> bit & 1
             if t and b:
                 parts.append(f"{fg}{bg}\u2580{reset}")
             elif t:
@@ -1,9 +1,11 @@
 """Convert a PIL Image to a half-block ANSI string for terminal display (256 colors)."""
 
 import math
+import weakref
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 from PIL import Image
 
 # The 6x6x6 color cube in the 256-color palette starts at index 16.
@@ -15,7 +17,7 @@ _GRAY_VALUES = tuple(8 + 10 * i for i in range(24))
 
 
 # ---------------------------------------------------------------------------
-# RGB → CIE-Lab conversion (pure Python, no numpy)
+# RGB → CIE-Lab conversion
 # ---------------------------------------------------------------------------
 
 def _srgb_to_linear(c):
@@ -56,34 +58,52 @@ def _idx_to_rgb(idx: int):
     return _CUBE_VALUES[i // 36], _CUBE_VALUES[(i % 36) // 6], _CUBE_VALUES[i % 6]
 
 
-# Pre-compute Lab values for ANSI colors 16-255
-_PALETTE_LAB = []
-for _i in range(16, 256):
-    _PALETTE_LAB.append(_rgb_to_lab(*_idx_to_rgb(_i)))
-_PALETTE_LAB = tuple(_PALETTE_LAB)
+def _srgb_to_linear_vec(c):
+    """Array form of _srgb_to_linear."""
+    c = c / 255.0
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
 
 
-# Flatten palette Lab into separate L, a, b lists for faster iteration
-_PAL_L = tuple(lab[0] for lab in _PALETTE_LAB)
-_PAL_A = tuple(lab[1] for lab in _PALETTE_LAB)
-_PAL_B = tuple(lab[2] for lab in _PALETTE_LAB)
-_PAL_COUNT = len(_PALETTE_LAB)
+# sRGB (linear) → XYZ (D65), rows are X, Y, Z
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
 
 
-def _lab_nearest(L, a, b_val):
-    """Find the closest ANSI 256 index (16-255) for a Lab color."""
-    best = 0
-    best_dist = float("inf")
-    pal_l, pal_a, pal_b = _PAL_L, _PAL_A, _PAL_B
-    for i in range(_PAL_COUNT):
-        dL = L - pal_l[i]
-        da = a - pal_a[i]
-        db = b_val - pal_b[i]
-        d = dL * dL + da * da + db * db
-        if d < best_dist:
-            best_dist = d
-            best = i
-    return best + 16
+def _rgb_to_lab_vec(rgb):
+    """Array form of _rgb_to_lab: (N, 3) sRGB 0-255 -> (N, 3) float64 Lab."""
+    lin = _srgb_to_linear_vec(np.asarray(rgb, dtype=np.float64))
+    xyz = np.dot(lin, _RGB_TO_XYZ.T)
+    # normalize to D65 white point
+    xyz /= (0.95047, 1.0, 1.08883)
+    # XYZ to Lab
+    f = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16/116)
+    fx, fy, fz = f[:, 0], f[:, 1], f[:, 2]
+    return np.stack([116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)], axis=-1)
+
+
+# Lab values for ANSI colors 16-255, shape (240, 3)
+_PALETTE_LAB = _rgb_to_lab_vec([_idx_to_rgb(i) for i in range(16, 256)])
+
+
+def _lab_nearest_vec(lab, chunk=4096):
+    """Closest ANSI 256 index (16-255) for each row of an (N, 3) Lab array.
+
+    Distances are taken against the whole palette at once, in row chunks to
+    bound the (chunk, 240) temporaries.
+    """
+    pal_l, pal_a, pal_b = (_PALETTE_LAB[:, c] for c in range(3))
+    out = np.empty(len(lab), dtype=np.uint8)
+    for start in range(0, len(lab), chunk):
+        part = lab[start:start + chunk]
+        dL = part[:, 0, None] - pal_l
+        da = part[:, 1, None] - pal_a
+        db = part[:, 2, None] - pal_b
+        # argmin keeps the first of equal distances, like a strict < scan
+        out[start:start + chunk] = (dL * dL + da * da + db * db).argmin(axis=1) + 16
+    return out
 
 
 # Pre-compute RGB→ANSI256 lookup table using Lab matching.
@@ -91,74 +111,70 @@ def _lab_nearest(L, a, b_val):
 _LUT_STEP = 8
 _LUT_SIZE = 256 // _LUT_STEP  # 32
 
-_RGB_TO_256_LUT = [[[0] * _LUT_SIZE for _ in range(_LUT_SIZE)] for _ in range(_LUT_SIZE)]
-for _ri in range(_LUT_SIZE):
-    for _gi in range(_LUT_SIZE):
-        for _bi in range(_LUT_SIZE):
-            _L, _a, _bv = _rgb_to_lab(
-                min(_ri * _LUT_STEP, 255),
-                min(_gi * _LUT_STEP, 255),
-                min(_bi * _LUT_STEP, 255),
-            )
-            _RGB_TO_256_LUT[_ri][_gi][_bi] = _lab_nearest(_L, _a, _bv)
+_LUT_LEVELS = np.minimum(np.arange(_LUT_SIZE) * _LUT_STEP, 255)
+_LUT = _lab_nearest_vec(_rgb_to_lab_vec(
+    np.stack(np.meshgrid(_LUT_LEVELS, _LUT_LEVELS, _LUT_LEVELS, indexing="ij"), axis=-1).reshape(-1, 3)
+)).reshape(_LUT_SIZE, _LUT_SIZE, _LUT_SIZE)
+_LUT_SHIFT = _LUT_STEP.bit_length() - 1  # v // _LUT_STEP == v >> _LUT_SHIFT
+_LUT_BITS = _LUT_SIZE.bit_length() - 1  # bits per channel in a flat LUT index
+_LUT_FLAT = _LUT.ravel()
+
+
+# RGB of every ANSI 256 index (16-255 are meaningful), for error and preview math.
+_IDX_TO_RGB = np.array([_idx_to_rgb(i) for i in range(256)], dtype=np.uint8)
+
+
+def _img_to_array(img: Image.Image) -> np.ndarray:
+    """The pixels of an RGB image as one (height, width, 3) uint8 array, copied in a single read."""
+    w, h = img.size
+    return np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(h, w, 3)
+
 
+def _rgb_array_to_256(rgb: np.ndarray) -> np.ndarray:
+    """Map (..., 3) uint8 RGB to the closest (...) uint8 ANSI 256 indices (Lab-based LUT).
 
-def _rgb_to_256(r: int, g: int, b: int) -> int:
-    """Map an RGB value to the closest ANSI 256-color index (Lab-based LUT)."""
-    return _RGB_TO_256_LUT[r // _LUT_STEP][g // _LUT_STEP][b // _LUT_STEP]
+    The three bins are packed into one 15-bit index into the flat LUT, which is
+    about 3x faster than a three-array fancy index.
+    """
+    bins = (rgb >> _LUT_SHIFT).astype(np.uint16)
+    flat = bins[..., 0] << (2 * _LUT_BITS) | bins[..., 1] << _LUT_BITS | bins[..., 2]
+    return np.take(_LUT_FLAT, flat)
 
 
-def load_lut(path: str) -> list:
+def load_lut(path: str) -> np.ndarray:
     """Load a palette LUT from a PNG file (16x16 grid, 32x32 swatches).
 
-    Returns a remap table of 256 entries: remap[original_index] = new_index.
+    Returns a uint8 remap table of 256 entries: remap[original_index] = new_index.
     """
-    img = Image.open(path).convert("RGB")
-    pixels = img.load()
-    w, h = img.size
+    arr = _img_to_array(Image.open(path).convert("RGB"))
+    h, w = arr.shape[:2]
     swatch_w = w // 16
     swatch_h = h // 16
     cx = swatch_w // 2
     cy = swatch_h // 2
 
-    remap = [0] * 256
-    for idx in range(256):
-        row, col = idx // 16, idx % 16
-        r, g, b = pixels[col * swatch_w + cx, row * swatch_h + cy]
-        remap[idx] = _rgb_to_256(r, g, b)
-    return remap
+    # Center pixel of every swatch in one strided read, row-major like the indices
+    return _rgb_array_to_256(arr[cy::swatch_h, cx::swatch_w][:16, :16]).reshape(256)
 
 
-def make_remap(palette_rgb):
-    """Build a 256→256 remap table that restricts output to the given RGB palette.
+def make_remap(palette_rgb) -> np.ndarray:
+    """Build a 256→256 uint8 remap table that restricts output to the given RGB palette.
 
     palette_rgb: list of (r, g, b) tuples defining the allowed colors.
     For each ANSI 256 color, finds the nearest palette color, then its nearest ANSI 256 index.
     """
     # Pre-compute ANSI index for each palette color
-    palette_idx = [_rgb_to_256(r, g, b) for r, g, b in palette_rgb]
-    # Pre-compute RGB for each palette entry (snapped to ANSI)
-    palette_ansi_rgb = [_idx_to_rgb(idx) for idx in palette_idx]
-
-    remap = [0] * 256
-    for i in range(256):
-        r, g, b = _idx_to_rgb(i)
-        best = 0
-        best_dist = float("inf")
-        for j, (pr, pg, pb) in enumerate(palette_rgb):
-            d = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
-            if d < best_dist:
-                best_dist = d
-                best = j
-        remap[i] = palette_idx[best]
-    return remap
+    palette_idx = _rgb_array_to_256(np.asarray(palette_rgb, dtype=np.uint8))
+    # Squared RGB distance from every ANSI color to every palette color, (256, N);
+    # argmin keeps the first of equal distances
+    diff = _IDX_TO_RGB.astype(np.int32)[:, None, :] - np.asarray(palette_rgb, dtype=np.int32)[None, :, :]
+    nearest = (diff * diff).sum(axis=-1).argmin(axis=1)
+    return palette_idx[nearest]
 
 
 def _apply_remap(idx_grid, remap):
-    """Apply a 256→256 remap table to an index grid in place."""
-    for y in range(len(idx_grid)):
-        for x in range(len(idx_grid[0])):
-            idx_grid[y][x] = remap[idx_grid[y][x]]
+    """Apply a 256→256 remap table to a uint8 index grid in place."""
+    np.take(np.asarray(remap, dtype=np.uint8), idx_grid, out=idx_grid)
 
 
 # Bayer 4x4 threshold matrix, normalized to [-0.5, 0.5) range
@@ -173,98 +189,162 @@ _BAYER_4x4 = [
 def _posterize(img: Image.Image, levels: int) -> Image.Image:
     """Reduce color levels per channel. levels=4 → 4 levels, levels=2 → 2 levels."""
     factor = 256 // levels
-    pixels = img.load()
-    w, h = img.size
-    out = img.copy()
-    out_pixels = out.load()
+    arr = _img_to_array(img).astype(np.uint16)
+    out = np.minimum(arr // factor * factor + factor // 2, 255).astype(np.uint8)
+    return Image.fromarray(out)
+
+
+def _floyd(arr: np.ndarray) -> np.ndarray:
+    """Floyd-Steinberg dither an (h, w, 3) RGB array to ANSI 256 indices.
+
+    Error diffusion is sequential, so this stays a scalar loop, but over
+    plain float rows with the LUT and palette bound to locals. PIL's C
+    quantize(dither=FLOYDSTEINBERG) is not a drop-in: it matches colors by
+    RGB distance, where every path here matches through the Lab LUT. Deposits are
+    carried in locals until a cell's last one arrives, so every cell of the
+    row below is read and written once, with the additions in the usual order.
+    """
+    h, w = arr.shape[:2]
+    src = arr.astype(np.float64)
+    reds, greens, blues = (src[..., c].tolist() for c in range(3))
+    lut = _LUT.tobytes()
+    shift, size, size2 = _LUT_SHIFT, _LUT_SIZE, _LUT_SIZE * _LUT_SIZE
+    pal_r, pal_g, pal_b = (_IDX_TO_RGB[:, c].tolist() for c in range(3))
+    grid = np.empty((h, w), dtype=np.uint8)
+    # Error rows land in a scratch row after the last scanline
+    spare = [0.0] * w
+
     for y in range(h):
+        cur_r, cur_g, cur_b = reds[y], greens[y], blues[y]
+        if y + 1 < h:
+            nxt_r, nxt_g, nxt_b = reds[y + 1], greens[y + 1], blues[y + 1]
+        else:
+            nxt_r, nxt_g, nxt_b = spare, spare[:], spare[:]
+        # east: the 7/16 deposit for x. sw: cell x-1 below, missing only its 3/16.
+        # s: cell x below, missing its 5/16 and 3/16.
+        east_r = east_g = east_b = 0.0
+        sw_r = sw_g = sw_b = 0.0
+        s_r, s_g, s_b = nxt_r[0], nxt_g[0], nxt_b[0]
+        row = [0] * w
         for x in range(w):
-            r, g, b = pixels[x, y]
-            out_pixels[x, y] = (
-                (r // factor) * factor + factor // 2,
-                (g // factor) * factor + factor // 2,
-                (b // factor) * factor + factor // 2,
-            )
-    return out
+            if x:
+                r, g, b = cur_r[x] + east_r, cur_g[x] + east_g, cur_b[x] + east_b
+            else:
+                r, g, b = cur_r[0], cur_g[0], cur_b[0]
+            # Clamp to 0..255, then to LUT bins; comparisons beat max/min calls
+            cr, cg, cb = round(r), round(g), round(b)
+            cr = 0 if cr < 0 else 255 if cr > 255 else cr
+            cg = 0 if cg < 0 else 255 if cg > 255 else cg
+            cb = 0 if cb < 0 else 255 if cb > 255 else cb
+            idx = lut[(cr >> shift) * size2 + (cg >> shift) * size + (cb >> shift)]
+            row[x] = idx
+            er, eg, eb = r - pal_r[idx], g - pal_g[idx], b - pal_b[idx]
+            east_r, east_g, east_b = er*7/16, eg*7/16, eb*7/16
+            if x:
+                nxt_r[x-1] = sw_r + er*3/16
+                nxt_g[x-1] = sw_g + eg*3/16
+                nxt_b[x-1] = sw_b + eb*3/16
+            sw_r, sw_g, sw_b = s_r + er*5/16, s_g + eg*5/16, s_b + eb*5/16
+            if x + 1 < w:
+                s_r = nxt_r[x+1] + er*1/16
+                s_g = nxt_g[x+1] + eg*1/16
+                s_b = nxt_b[x+1] + eb*1/16
+        nxt_r[w-1], nxt_g[w-1], nxt_b[w-1] = sw_r, sw_g, sw_b
+        grid[y] = row
+    return grid
 
 
-def _build_idx_grid(img: Image.Image, dither: str = "none", remap: Optional[list] = None, poster: int = 0):
+def _build_idx_grid(img: Image.Image, dither: str = "none", remap: Optional[np.ndarray] = None, poster: int = 0) -> np.ndarray:
     """Build a 2D grid of ANSI 256 color indices from a PIL RGB image.
 
     dither: "none", "floyd" (Floyd-Steinberg), or "ordered" (Bayer 4x4).
-    remap: optional 256-entry remap table (from load_lut).
+    remap: optional 256-entry uint8 remap table (from load_lut or make_remap).
     poster: 0=off, or number of levels per channel (e.g. 4, 2).
-    Returns list[list[int]] of shape [height][width].
+    Returns a uint8 ndarray of shape (height, width).
     """
     if poster > 0:
         img = _posterize(img, poster)
     w, h = img.size
-    pixels = img.load()
+    arr = _img_to_array(img)
 
     if dither == "floyd":
-        # Work on float copy for error diffusion
-        buf = [[(0.0, 0.0, 0.0)] * w for _ in range(h)]
-        for y in range(h):
-            for x in range(w):
-                buf[y][x] = tuple(float(c) for c in pixels[x, y])
-
-        grid = [[0] * w for _ in range(h)]
-        for y in range(h):
-            for x in range(w):
-                r, g, b = buf[y][x]
-                cr = max(0, min(255, round(r)))
-                cg = max(0, min(255, round(g)))
-                cb = max(0, min(255, round(b)))
-                idx = _rgb_to_256(cr, cg, cb)
-                grid[y][x] = idx
-                pr, pg, pb = _idx_to_rgb(idx)
-                er, eg, eb = r - pr, g - pg, b - pb
-                if x + 1 < w:
-                    buf[y][x+1] = (buf[y][x+1][0] + er*7/16,
-                                   buf[y][x+1][1] + eg*7/16,
-                                   buf[y][x+1][2] + eb*7/16)
-                if y + 1 < h:
-                    if x - 1 >= 0:
-                        buf[y+1][x-1] = (buf[y+1][x-1][0] + er*3/16,
-                                         buf[y+1][x-1][1] + eg*3/16,
-                                         buf[y+1][x-1][2] + eb*3/16)
-                    buf[y+1][x] = (buf[y+1][x][0] + er*5/16,
-                                   buf[y+1][x][1] + eg*5/16,
-                                   buf[y+1][x][2] + eb*5/16)
-                    if x + 1 < w:
-                        buf[y+1][x+1] = (buf[y+1][x+1][0] + er*1/16,
-                                         buf[y+1][x+1][1] + eg*1/16,
-                                         buf[y+1][x+1][2] + eb*1/16)
+        grid = _floyd(arr)
 
     elif dither == "ordered":
+        # Offset every pixel by its Bayer threshold, tiled over the image
         spread = 32  # amplitude of the Bayer offset
-        grid = [[0] * w for _ in range(h)]
-        for y in range(h):
-            for x in range(w):
-                r, g, b = pixels[x, y]
-                offset = _BAYER_4x4[y % 4][x % 4] * spread
-                cr = max(0, min(255, round(r + offset)))
-                cg = max(0, min(255, round(g + offset)))
-                cb = max(0, min(255, round(b + offset)))
-                grid[y][x] = _rgb_to_256(cr, cg, cb)
+        tile = np.tile(np.array(_BAYER_4x4) * spread, (h // 4 + 1, w // 4 + 1))[:h, :w]
+        shifted = np.rint(arr + tile[..., None])
+        grid = _rgb_array_to_256(np.clip(shifted, 0, 255).astype(np.uint8))
 
     else:  # "none"
-        grid = [[0] * w for _ in range(h)]
-        for y in range(h):
-            for x in range(w):
-                grid[y][x] = _rgb_to_256(*pixels[x, y])
+        grid = _rgb_array_to_256(arr)
 
-    if remap:
+    if remap is not None:
         _apply_remap(grid, remap)
     return grid
 
 
-def render_image(image: Image.Image, columns: int, border: bool = False, caption: str = None, resample=Image.LANCZOS, dither: str = "none", remap: Optional[list] = None, poster: int = 0, glyph: str = "\u2580") -> str:
-    """Render an image as 256-color ANSI text using Unicode half-block characters.
+# Resized copies per source image, keyed by id() and dropped when the image is
+# collected. Images are treated as immutable once they have been rendered.
+_RESIZE_CACHE: dict = {}
+_RESIZE_CACHE_SIZES = 8  # per source image
+
+
+def _resized(image: Image.Image, size: tuple, resample) -> Image.Image:
+    """image.convert("RGB").resize(size, resample), reused while image is alive."""
+    key = id(image)
+    entry = _RESIZE_CACHE.get(key)
+    if entry is None or entry[0]() is not image:
+        ref = weakref.ref(image, lambda _, key=key: _RESIZE_CACHE.pop(key, None))
+        entry = _RESIZE_CACHE[key] = (ref, {})
+    resized = entry[1]
+    out = resized.get((image.size, size, resample))
+    if out is None:
+        if len(resized) >= _RESIZE_CACHE_SIZES:
+            del resized[next(iter(resized))]
+        out = resized[(image.size, size, resample)] = image.convert("RGB").resize(size, resample)
+    return out
 
-    Each character cell encodes two vertical pixels:
-    - top pixel as foreground color (U+2580 ▀)
-    - bottom pixel as background color
+
+def build_grid(image: Image.Image, columns: int, border: bool = False, resample=Image.LANCZOS, dither: str = "none", poster: int = 0) -> np.ndarray:
+    """Resize and quantize an image to the ANSI 256 index grid drawn by render_image.
+
+    This is the expensive half of render_image. The grid is a contiguous uint8
+    array of shape (rows, columns), returned before any palette remap so it can
+    be reused with render_grid for several palettes.
+    """
+    inner = columns - 2 if border else columns
+    rows = inner  # keep square aspect for image area
+    if rows % 2 != 0:
+        rows += 1
+    img = _resized(image, (inner, rows), resample)
+    return _build_idx_grid(img, dither, None, poster)
+
+
+# Finished cell strings per glyph, indexed by the packed (fg << 8) | bg pair and
+# filled in as pairs first appear, so each pair is formatted once per process.
+_ESC_CACHE: dict = {}
+
+
+def _cell_escapes(pairs: np.ndarray, glyph: str) -> np.ndarray:
+    """Look up the cell string for every packed color pair in pairs."""
+    cached = _ESC_CACHE.get(glyph)
+    if cached is None:
+        cached = _ESC_CACHE[glyph] = (np.empty(1 << 16, dtype=object), np.zeros(1 << 16, dtype=bool))
+    table, known = cached
+    new = np.unique(pairs[~known[pairs]])
+    if len(new):
+        table[new] = [f"\033[38;5;{pair >> 8};48;5;{pair & 0xFF}m{glyph}" for pair in new.tolist()]
+        known[new] = True
+    return table[pairs]
+
+
+def render_grid(idx_grid: np.ndarray, columns: int, border: bool = False, caption: str = None, remap: Optional[np.ndarray] = None, glyph: str = "\u2580") -> str:
+    """Format an index grid from build_grid as half-block ANSI text.
+
+    remap is applied on the fly, so idx_grid is left untouched. A nested list
+    of indices is accepted too and converted to a uint8 array.
     """
     if border:
         pad = 1  # side border thickness in columns
@@ -272,52 +352,62 @@ def render_image(image: Image.Image, columns: int, border: bool = False, caption
     else:
         pad = 0
         inner = columns
+    idx_grid = np.asarray(idx_grid, dtype=np.uint8)
+    rows = len(idx_grid)
 
-    rows = inner  # keep square aspect for image area
-    if rows % 2 != 0:
-        rows += 1
-    img = image.convert("RGB").resize((inner, rows), resample)
-    idx_grid = _build_idx_grid(img, dither, remap, poster)
+    if remap is not None:
+        idx_grid = np.take(np.asarray(remap, dtype=np.uint8), idx_grid)
+
+    pairs = idx_grid[0:rows:2, :inner].astype(np.uint16) << 8 | idx_grid[1:rows:2, :inner]
+    cells = _cell_escapes(pairs, glyph)
+    # A cell with the same colors as its left neighbour only needs the glyph:
+    # the SGR state carries over until the next escape or the line's reset.
+    cells[:, 1:][pairs[:, 1:] == pairs[:, :-1]] = glyph
+    cell_rows = cells.tolist()
 
     white = "\033[48;5;231m"
     reset = "\033[0m"
     border_char = " "
+    # Border pieces are the same on every line; build them once
+    full = white + border_char * columns + reset
+    side = white + border_char * pad if border else ""
+    tail = side + reset
 
     lines: list[str] = []
 
     if border:
-        lines.append(white + border_char * columns + reset)
-
-    for y in range(0, rows, 2):
-        parts: list[str] = []
-        if border:
-            parts.append(white + border_char * pad)
-        for x in range(inner):
-            fg = idx_grid[y][x]
-            bg = idx_grid[y + 1][x]
-            parts.append(f"\033[38;5;{fg};48;5;{bg}m{glyph}")
-        if border:
-            parts.append(white + border_char * pad)
-        lines.append("".join(parts) + reset)
+        lines.append(full)
+
+    lines.extend([side + "".join(cells) + tail for cells in cell_rows])
 
     if border:
         if caption:
-            lines.append(white + border_char * columns + reset)
+            lines.append(full)
             text = caption[:columns - pad * 2]
             padding = columns - pad * 2 - len(text)
             left = padding // 2
             right = padding - left
             black = "\033[38;5;232m"
-            lines.append(white + border_char * pad + black + border_char * left + text + border_char * right + reset + white + border_char * pad + reset)
-            lines.append(white + border_char * columns + reset)
+            lines.append(side + black + border_char * left + text + border_char * right + reset + tail)
+            lines.append(full)
         else:
-            for _ in range(4):
-                lines.append(white + border_char * columns + reset)
+            lines.extend([full] * 4)
 
     return "\n".join(lines)
 
 
-def render_preview(image: Image.Image, columns: int, scale: int = 8, resample=Image.LANCZOS, dither: str = "none", remap: Optional[list] = None, poster: int = 0) -> Image.Image:
+def render_image(image: Image.Image, columns: int, border: bool = False, caption: str = None, resample=Image.LANCZOS, dither: str = "none", remap: Optional[np.ndarray] = None, poster: int = 0, glyph: str = "\u2580") -> str:
+    """Render an image as 256-color ANSI text using Unicode half-block characters.
+
+    Each character cell encodes two vertical pixels:
+    - top pixel as foreground color (U+2580 ▀)
+    - bottom pixel as background color
+    """
+    idx_grid = build_grid(image, columns, border, resample, dither, poster)
+    return render_grid(idx_grid, columns, border, caption, remap, glyph)
+
+
+def render_preview(image: Image.Image, columns: int, scale: int = 8, resample=Image.LANCZOS, dither: str = "none", remap: Optional[np.ndarray] = None, poster: int = 0) -> Image.Image:
     """Render a scaled-up preview showing the exact 256-color terminal output.
 
     Returns a PIL Image where each terminal pixel is a (scale x scale) block.
@@ -325,17 +415,9 @@ def render_preview(image: Image.Image, columns: int, scale: int = 8, resample=Im
     rows = columns
     if rows % 2 != 0:
         rows += 1
-    img = image.convert("RGB").resize((columns, rows), resample)
+    img = _resized(image, (columns, rows), resample)
     idx_grid = _build_idx_grid(img, dither, remap, poster)
 
-    preview = Image.new("RGB", (columns * scale, rows * scale))
-    preview_pixels = preview.load()
-
-    for y in range(rows):
-        for x in range(columns):
-            r, g, b = _idx_to_rgb(idx_grid[y][x])
-            for dy in range(scale):
-                for dx in range(scale):
-                    preview_pixels[x * scale + dx, y * scale + dy] = (r, g, b)
-
-    return preview
+    # Palette colors for every cell, then each cell blown up to a scale x scale block
+    rgb = _IDX_TO_RGB[idx_grid]
+    return Image.fromarray(rgb.repeat(scale, axis=0).repeat(scale, axis=1))
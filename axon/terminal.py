@@ -1,8 +1,42 @@
 """Terminal size detection."""
 
 import shutil
+import signal
+
+# Cached width; SIGWINCH clears it. Only cached once the handler is installed.
+_width = None
+_watching = False
+_previous_handler = None
+
+
+def _on_resize(signum, frame):
+    """SIGWINCH: forget the cached width, then run whatever handler was there before."""
+    global _width
+    _width = None
+    if callable(_previous_handler):
+        _previous_handler(signum, frame)
+
+
+def _watch_resizes() -> bool:
+    """Install the SIGWINCH handler once; False where that isn't possible."""
+    global _watching, _previous_handler
+    if not _watching and hasattr(signal, "SIGWINCH"):
+        try:
+            _previous_handler = signal.signal(signal.SIGWINCH, _on_resize)
+            _watching = True
+        except ValueError:  # not the main thread
+            pass
+    return _watching
 
 
 def get_terminal_width() -> int:
     """Return the current terminal width in columns."""
-    return shutil.get_terminal_size().columns
+    global _width
+    if _width is not None:
+        return _width
+    # Install the handler before measuring so a resize in between isn't lost
+    watching = _watch_resizes()
+    columns = shutil.get_terminal_size().columns
+    if watching:
+        _width = columns
+    return columns